@@ -1,11 +1,13 @@
-from fastapi import FastAPI, Request, HTTPException
-from fastapi.responses import JSONResponse
+import anyio.to_thread
+import orjson
+from fastapi import FastAPI, Request, HTTPException, Response
+from fastapi.responses import ORJSONResponse
 from fastapi.exceptions import RequestValidationError
 from contextlib import asynccontextmanager
 
 from app.core.config import settings
 from app.core.exceptions import RAGBaseException
-from app.core.logging import get_logger
+from app.core.logging import get_logger, shutdown_logging
 from app.presentation.documents.controller import router as documents_router
 from app.presentation.chat.controller import router as chat_router
 from app.presentation.middleware import (
@@ -24,18 +26,46 @@ from app.presentation.error_handler import (
 
 logger = get_logger(__name__)
 
+# Static payloads serialized once at import; / and /health (polled by
+# liveness probes) then skip serialization entirely per request
+_ROOT_BODY = orjson.dumps({"message": "Welcome to RAG System with ChromaDB"})
+_HEALTH_BODY = orjson.dumps({"status": "healthy"})
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan manager."""
     # Startup
     logger.info("Starting up the application...")
+
+    # Embedding and ChromaDB calls are offloaded to worker threads; raise the
+    # default anyio limit (40) so concurrent requests are not serialized there
+    limiter = anyio.to_thread.current_default_thread_limiter()
+    limiter.total_tokens = 64
+
+    # Construct the dependency singletons and warm the embedding model so
+    # the first real request does not pay repository/model-load latency
+    import asyncio
+
+    from app.core.dependencies import get_document_use_case
+    from app.infrastructure.embedding_service import embedding_service
+
+    await asyncio.to_thread(get_document_use_case)
+    await asyncio.to_thread(embedding_service.generate_single_embedding, "warmup")
+
+    # Prime the Gemini HTTP connection so the first chat request does not
+    # pay for DNS resolution and the TLS handshake
+    from app.infrastructure.gemini_adapter import gemini_adapter
+
+    await gemini_adapter.warmup()
+
     logger.info("Application started successfully.")
 
     yield
 
     # Shutdown
     logger.info("Shutting down the application...")
+    shutdown_logging()
 
 
 def create_app() -> FastAPI:
@@ -46,6 +76,7 @@ def create_app() -> FastAPI:
         version=settings.APP_VERSION,
         debug=settings.DEBUG,
         lifespan=lifespan,
+        default_response_class=ORJSONResponse,
     )
 
     # Add middleware (order matters - first added is outermost)
@@ -63,19 +94,22 @@ def create_app() -> FastAPI:
     @app.exception_handler(Exception)
     async def comprehensive_exception_handler(request: Request, exc: Exception):
         """Comprehensive exception handler to ensure JSON responses."""
+        # scope["path"] is already a plain str; request.url would rebuild
+        # the full URL object just to take the path back off it
+        path = request.scope["path"]
         logger.error(
             f"Comprehensive exception handler caught: {str(exc)}", exc_info=True
         )
         logger.error(f"Exception type: {type(exc).__name__}")
-        logger.error(f"Request path: {request.url.path}")
+        logger.error(f"Request path: {path}")
 
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=500,
             content={
                 "error": {
                     "type": "ComprehensiveExceptionHandler",
                     "message": "An unexpected error occurred",
-                    "path": str(request.url.path),
+                    "path": path,
                     "exception_type": type(exc).__name__,
                     "exception_message": str(exc),
                 }
@@ -85,12 +119,12 @@ def create_app() -> FastAPI:
     @app.get("/")
     async def read_root():
         """Root endpoint."""
-        return {"message": "Welcome to RAG System with ChromaDB"}
+        return Response(content=_ROOT_BODY, media_type="application/json")
 
     @app.get("/health")
     async def health_check():
         """Health check endpoint."""
-        return {"status": "healthy"}
+        return Response(content=_HEALTH_BODY, media_type="application/json")
 
     # Include API routes
     app.include_router(documents_router, prefix="/api/v1", tags=["documents"])
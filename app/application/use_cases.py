@@ -1,4 +1,4 @@
-from typing import Optional, List, Dict, Any
+from typing import BinaryIO, Optional, List, Dict, Any, Union
 from app.domain.document_repositories import DocumentRepository
 from app.domain.rag_repositories import RAGRepository
 from app.domain.document_entities import Document, SearchResult, CollectionStats
@@ -81,13 +81,16 @@ class DocumentUseCase:
 
     async def process_and_add_files(
         self,
-        files: List[Dict[str, Any]],
+        filenames: List[str],
+        contents: List[Union[bytes, BinaryIO]],
         metadatas: Optional[List[Dict[str, Any]]] = None,
         ids: Optional[List[str]] = None,
     ) -> Dict[str, Any]:
         """Process uploaded files and add them to the knowledge base."""
         # Process all files
-        processed_files = await self.file_processor.process_multiple_files(files)
+        processed_files = await self.file_processor.process_multiple_files(
+            filenames, contents
+        )
 
         # Separate successful and failed processing
         successful_files = []
@@ -131,7 +134,7 @@ class DocumentUseCase:
 
     async def process_single_file(
         self,
-        file_content: bytes,
+        file_content: Union[bytes, BinaryIO],
         filename: str,
         metadata: Optional[Dict[str, Any]] = None,
         document_id: Optional[str] = None,
@@ -1,5 +1,6 @@
 from pydantic_settings import BaseSettings
 from typing import Optional, List
+import logging
 import os
 
 
@@ -20,6 +21,7 @@ class Settings(BaseSettings):
     CHROMA_SERVER_PORT: int = 8000  # ChromaDB server port
     CHROMA_TELEMETRY_ANONYMIZED: bool = False  # Disable ChromaDB telemetry
     CHROMA_TELEMETRY: bool = False  # Disable ChromaDB telemetry
+    USE_FAISS: bool = True  # FAISS fast-path for search (needs faiss-cpu)
 
     # Embeddings
     EMBEDDING_MODEL: str = (
@@ -27,6 +29,12 @@ class Settings(BaseSettings):
     )
     EMBEDDING_DEVICE: str = "cpu"  # "cpu" or "cuda" for GPU
     EMBEDDING_BATCH_SIZE: int = 32  # Batch size for embedding generation
+    QUANTIZE_EMBEDDINGS: bool = False  # Snap stored embeddings to an int8 grid
+    COMPILE_EMBEDDINGS: bool = False  # torch.compile the embedding model at startup
+    EMBEDDING_USE_BF16: bool = False  # Run embedding inference in bfloat16
+
+    # Uploads
+    UPLOAD_CONCURRENCY: int = 8  # Max concurrent file reads in multi-upload
 
     # RAG Configuration
     RAG_DISTANCE_THRESHOLD: float = (
@@ -43,6 +51,11 @@ class Settings(BaseSettings):
     # Logging
     LOG_LEVEL: str = "INFO"
 
+    @property
+    def LOG_LEVEL_NUM(self) -> int:
+        """Numeric log level, resolved once instead of per import site."""
+        return logging.getLevelName(self.LOG_LEVEL.upper())
+
     class Config:
         env_file = ".env"
         env_file_encoding = "utf-8"
@@ -1,13 +1,16 @@
 """Dependency injection setup for the application."""
 
+from functools import lru_cache
+
 from app.infrastructure.chroma_repository import ChromaRepository
 from app.infrastructure.file_processor import FileProcessor
 from app.application.use_cases import DocumentUseCase
 from app.core.config import settings
 
 
+@lru_cache(maxsize=1)
 def get_document_repository() -> ChromaRepository:
-    """Get the document repository instance."""
+    """Get the document repository singleton."""
     return ChromaRepository(
         persist_directory=settings.CHROMA_PERSIST_DIRECTORY,
         collection_name=settings.CHROMA_COLLECTION_NAME,
@@ -16,13 +19,15 @@ def get_document_repository() -> ChromaRepository:
     )
 
 
+@lru_cache(maxsize=1)
 def get_file_processor() -> FileProcessor:
-    """Get the file processor instance."""
+    """Get the file processor singleton."""
     return FileProcessor()
 
 
+@lru_cache(maxsize=1)
 def get_document_use_case() -> DocumentUseCase:
-    """Get the document use case instance."""
+    """Get the document use case singleton."""
     repository = get_document_repository()
     file_processor = get_file_processor()
     return DocumentUseCase(
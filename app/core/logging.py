@@ -3,10 +3,15 @@ Central logging configuration for the RAG system.
 """
 
 import logging
+import logging.handlers
+import queue
 import sys
 from typing import Optional
 from app.core.config import settings
 
+# Background listener draining the log queue; stopped on app shutdown
+_queue_listener: Optional[logging.handlers.QueueListener] = None
+
 
 class ColoredFormatter(logging.Formatter):
     """Custom formatter with colors for different log levels."""
@@ -45,8 +50,11 @@ def setup_logging(
     Returns:
         Configured logger instance
     """
-    # Get log level from config or parameter
-    log_level = level or settings.LOG_LEVEL
+    # Resolve the numeric log level once instead of per setLevel call
+    if level is not None:
+        level_num = logging.getLevelName(level.upper())
+    else:
+        level_num = settings.LOG_LEVEL_NUM
 
     # Default format string
     if format_string is None:
@@ -60,7 +68,7 @@ def setup_logging(
 
     # Configure root logger
     root_logger = logging.getLogger()
-    root_logger.setLevel(getattr(logging, log_level.upper()))
+    root_logger.setLevel(level_num)
 
     # Remove existing handlers
     for handler in root_logger.handlers[:]:
@@ -68,11 +76,22 @@ def setup_logging(
 
     # Create console handler
     console_handler = logging.StreamHandler(sys.stdout)
-    console_handler.setLevel(getattr(logging, log_level.upper()))
+    console_handler.setLevel(level_num)
     console_handler.setFormatter(formatter)
 
-    # Add handler to root logger
-    root_logger.addHandler(console_handler)
+    # Route records through a queue so callers only pay for an enqueue;
+    # formatting and stream I/O happen on the listener's background thread
+    # instead of serializing request handlers on the stream lock
+    global _queue_listener
+    if _queue_listener is not None:
+        _queue_listener.stop()
+
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    _queue_listener = logging.handlers.QueueListener(
+        log_queue, console_handler, respect_handler_level=True
+    )
+    _queue_listener.start()
 
     # Configure specific loggers
     configure_loggers()
@@ -103,6 +122,14 @@ def configure_loggers():
         logging.getLogger(logger_name).setLevel(logging.DEBUG)
 
 
+def shutdown_logging():
+    """Stop the background log listener, flushing any queued records."""
+    global _queue_listener
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        _queue_listener = None
+
+
 def get_logger(name: str) -> logging.Logger:
     """
     Get a logger instance with the given name.
@@ -8,14 +8,35 @@ os.environ["CHROMA_TELEMETRY_ANONYMIZED"] = str(
 ).lower()
 os.environ["CHROMA_TELEMETRY"] = str(settings.CHROMA_TELEMETRY).lower()
 
+import asyncio
+import io
+
 import chromadb
 from chromadb.config import Settings
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, MutableMapping, Optional
 import uuid
 from datetime import datetime
 import json
 import time
 import numpy as np
+
+# FAISS is an optional dependency for the search fast-path
+try:
+    import faiss
+
+    FAISS_AVAILABLE = True
+except ImportError:
+    FAISS_AVAILABLE = False
+
+# cachetools bounds the document-hydration cache; a size-capped dict
+# stands in when it is missing
+try:
+    from cachetools import LRUCache
+
+    CACHETOOLS_AVAILABLE = True
+except ImportError:
+    CACHETOOLS_AVAILABLE = False
+
 from app.core.config import settings
 from app.infrastructure.embedding_service import embedding_service
 from app.core.logging import get_logger
@@ -26,6 +47,9 @@ from app.domain.rag_entities import RAGContext
 
 logger = get_logger(__name__)
 
+# Upper bound on cached hydrated documents (full text per entry)
+_DOC_CACHE_MAX = 4096
+
 
 class ChromaRepository(DocumentRepository, RAGRepository):
     """ChromaDB repository for vector storage and retrieval."""
@@ -36,8 +60,17 @@ class ChromaRepository(DocumentRepository, RAGRepository):
         collection_name: str = "documents",
         host: Optional[str] = None,
         port: Optional[int] = None,
+        hnsw_m: int = 24,
+        hnsw_ef_construction: int = 128,
+        hnsw_ef_search: int = 100,
     ):
-        """Initialize ChromaDB client and collection."""
+        """Initialize ChromaDB client and collection.
+
+        The hnsw_* parameters tune the index ChromaDB builds for the
+        collection: m is the graph degree, ef_construction the candidate
+        list while inserting, ef_search the candidate list while
+        querying. They only take effect when the collection is created.
+        """
         if host:
             # Use remote ChromaDB server with retry
             self.client = self._connect_with_retry(host, port)
@@ -53,8 +86,47 @@ class ChromaRepository(DocumentRepository, RAGRepository):
             logger.info(f"Using local ChromaDB at: {persist_directory}")
 
         self.collection_name = collection_name
+        self.hnsw_m = hnsw_m
+        self.hnsw_ef_construction = hnsw_ef_construction
+        self.hnsw_ef_search = hnsw_ef_search
         self.collection = self._get_or_create_collection()
 
+        # Optional FAISS mirror of the collection embeddings for fast top-k
+        # search; ChromaDB stays the source of truth for documents/metadata
+        self._faiss_index = None
+        self._faiss_ids: List[str] = []
+        # Documents hydrated from ChromaDB during FAISS searches, keyed by
+        # ID, so repeat hits skip the per-query round-trip. Bounded, since
+        # each entry holds a document's full text
+        self._doc_cache: MutableMapping[str, Document] = (
+            LRUCache(maxsize=_DOC_CACHE_MAX) if CACHETOOLS_AVAILABLE else {}
+        )
+
+        # Set of document IDs seen by this process; an advisory fast-path
+        # for existence checks. Membership is trusted (skips a ChromaDB
+        # round-trip), but a miss is not authoritative — another worker or
+        # another client of a shared Chroma server may have added the
+        # document — so miss paths verify against ChromaDB and repair the
+        # set. None means the set could not be loaded.
+        self._known_ids: Optional[set] = None
+        self._load_known_ids()
+        if settings.USE_FAISS:
+            if host:
+                # The mirror only sees this process's writes; against a
+                # shared remote server it would silently miss documents
+                # added by other clients, so search stays on ChromaDB
+                logger.info(
+                    "USE_FAISS is enabled but ChromaDB is remote; "
+                    "skipping the local FAISS mirror."
+                )
+            elif FAISS_AVAILABLE:
+                self._build_faiss_index()
+            else:
+                logger.warning(
+                    "USE_FAISS is enabled but faiss is not installed. "
+                    "Falling back to ChromaDB search."
+                )
+
     def _connect_with_retry(
         self,
         host: str,
@@ -116,6 +188,13 @@ class ChromaRepository(DocumentRepository, RAGRepository):
                     "description": "Document embeddings for RAG system",
                     "embedding_model": settings.EMBEDDING_MODEL,
                     "embedding_dimension": embedding_dimension,
+                    # Cosine space keeps Chroma's distances on the same
+                    # scale as the FAISS mirror's cosine similarity
+                    # (the default l2 space would not be)
+                    "hnsw:space": "cosine",
+                    "hnsw:M": self.hnsw_m,
+                    "hnsw:construction_ef": self.hnsw_ef_construction,
+                    "hnsw:search_ef": self.hnsw_ef_search,
                 },
             )
             logger.info(
@@ -123,16 +202,140 @@ class ChromaRepository(DocumentRepository, RAGRepository):
             )
             return collection
 
+    def _load_known_ids(self):
+        """Load the set of existing document IDs from the collection."""
+        try:
+            results = self.collection.get(include=[])
+            self._known_ids = set(results["ids"]) if results["ids"] else set()
+        except Exception as e:
+            logger.warning(f"Failed to load document ID set: {e}")
+            self._known_ids = None
+
+    def _build_faiss_index(self):
+        """Build the FAISS index from the embeddings stored in ChromaDB."""
+        try:
+            dimension = embedding_service.get_embedding_dimension()
+            index = faiss.IndexFlatIP(dimension)
+            ids = []
+
+            results = self.collection.get(include=["embeddings"])
+            if results["ids"] and results["embeddings"] is not None:
+                vectors = np.ascontiguousarray(
+                    results["embeddings"], dtype=np.float32
+                )
+                if vectors.size:
+                    faiss.normalize_L2(vectors)
+                    index.add(vectors)
+                    ids = list(results["ids"])
+
+            self._faiss_index = index
+            self._faiss_ids = ids
+            logger.info(f"FAISS index ready with {index.ntotal} vectors")
+        except Exception as e:
+            logger.warning(
+                f"Failed to build FAISS index, falling back to ChromaDB search: {e}"
+            )
+            self._faiss_index = None
+            self._faiss_ids = []
+
+    def _faiss_add(self, ids: List[str], embeddings: np.ndarray):
+        """Mirror newly added embeddings into the FAISS index."""
+        if self._faiss_index is None:
+            return
+        try:
+            vectors = np.ascontiguousarray(embeddings, dtype=np.float32)
+            faiss.normalize_L2(vectors)
+            self._faiss_index.add(vectors)
+            self._faiss_ids.extend(ids)
+        except Exception as e:
+            logger.warning(f"Failed to update FAISS index, disabling it: {e}")
+            self._faiss_index = None
+            self._faiss_ids = []
+
+    def _search_faiss(self, query_embedding: np.ndarray, n_results: int):
+        """Search the FAISS index and resolve documents from ChromaDB by ID."""
+        query = np.ascontiguousarray(
+            query_embedding.reshape(1, -1), dtype=np.float32
+        )
+        faiss.normalize_L2(query)
+
+        k = min(n_results, self._faiss_index.ntotal)
+        scores, indices = self._faiss_index.search(query, k)
+
+        ids = [self._faiss_ids[i] for i in indices[0] if i != -1]
+        if not ids:
+            return []
+
+        missing_ids = [doc_id for doc_id in ids if doc_id not in self._doc_cache]
+        if missing_ids:
+            records = self.collection.get(ids=missing_ids)
+            for i, doc_id in enumerate(records["ids"]):
+                if (
+                    type(self._doc_cache) is dict
+                    and len(self._doc_cache) >= _DOC_CACHE_MAX
+                ):
+                    # Fallback store without LRU semantics: drop the oldest
+                    self._doc_cache.pop(next(iter(self._doc_cache)))
+                self._doc_cache[doc_id] = Document(
+                    id=doc_id,
+                    content=records["documents"][i] if records["documents"] else "",
+                    metadata=records["metadatas"][i] if records["metadatas"] else {},
+                )
+
+        search_results = []
+        for rank, (doc_id, score) in enumerate(zip(ids, scores[0]), 1):
+            document = self._doc_cache.get(doc_id)
+            if document is None:
+                continue
+            # Inner product of normalized vectors is cosine similarity.
+            # The float() matters: the search route declares a
+            # response_model, so pydantic serializes the payload and it
+            # rejects numpy.float32 scalars outright
+            similarity_score = float(max(0.0, min(1.0, score)))
+            search_results.append(
+                SearchResult(
+                    document=document, similarity_score=similarity_score, rank=rank
+                )
+            )
+        return search_results
+
+    @staticmethod
+    def _quantize_embeddings(
+        embeddings: np.ndarray, metadatas: List[Dict[str, Any]]
+    ) -> np.ndarray:
+        """Snap embeddings to a per-vector int8 grid before storage.
+
+        Each vector is scaled so its largest component maps to 127,
+        rounded to integers, and scaled back. ChromaDB only stores float
+        vectors, so this keeps the search space intact while reducing the
+        values to int8 precision; the per-vector scale is recorded in
+        metadata so the exact grid can be recovered later.
+        """
+        scale = np.abs(embeddings).max(axis=1, keepdims=True) / 127.0
+        scale[scale == 0] = 1.0
+        quantized = np.clip(np.round(embeddings / scale), -127, 127)
+        for metadata, vector_scale in zip(metadatas, scale[:, 0]):
+            metadata["embedding_scale"] = float(vector_scale)
+        return (quantized * scale).astype(np.float32)
+
     async def add_documents(
         self,
         documents: List[str],
         metadatas: Optional[List[Dict[str, Any]]] = None,
         ids: Optional[List[str]] = None,
+        batch_size: int = 1000,
     ) -> List[str]:
-        """Add documents to the collection with embeddings."""
+        """Add documents to the collection with embeddings.
+
+        Embeddings are computed for the whole list in one encode pass;
+        the inserts themselves go to ChromaDB in batch_size chunks so
+        large imports neither hold the index lock for the entire set nor
+        pay the per-call commit overhead once per document.
+        """
         try:
             if ids is None:
-                ids = [str(uuid.uuid4()) for _ in documents]
+                # uuid4().hex skips the dashed str() formatting of str(uuid4())
+                ids = [uuid.uuid4().hex for _ in documents]
 
             if metadatas is None:
                 metadatas = [
@@ -155,18 +358,33 @@ class ChromaRepository(DocumentRepository, RAGRepository):
                 flattened_metadatas.append(flattened)
 
             # Generate embeddings for documents
+            # (run in a worker thread so the event loop stays responsive)
             logger.info(f"Generating embeddings for {len(documents)} documents")
-            embeddings = embedding_service.generate_embeddings(documents)
+            embeddings = await asyncio.to_thread(
+                embedding_service.generate_embeddings, documents
+            )
 
-            # Convert numpy arrays to lists for ChromaDB
-            embeddings_list = [embedding.tolist() for embedding in embeddings]
+            if settings.QUANTIZE_EMBEDDINGS:
+                embeddings = self._quantize_embeddings(
+                    embeddings, flattened_metadatas
+                )
 
-            self.collection.add(
-                documents=documents,
-                metadatas=flattened_metadatas,
-                ids=ids,
-                embeddings=embeddings_list,
-            )
+            # ChromaDB accepts the numpy array directly; expanding it to
+            # per-row Python float lists only ballooned memory. The ID set
+            # and FAISS mirror are updated per batch so that a failure in
+            # a later batch leaves them consistent with what was committed
+            for start in range(0, len(documents), batch_size):
+                end = start + batch_size
+                await asyncio.to_thread(
+                    self.collection.add,
+                    documents=documents[start:end],
+                    metadatas=flattened_metadatas[start:end],
+                    ids=ids[start:end],
+                    embeddings=embeddings[start:end],
+                )
+                self._faiss_add(ids[start:end], embeddings[start:end])
+                if self._known_ids is not None:
+                    self._known_ids.update(ids[start:end])
 
             logger.info(
                 f"Added {len(documents)} documents with embeddings to collection"
@@ -182,11 +400,28 @@ class ChromaRepository(DocumentRepository, RAGRepository):
         """Search for similar documents using embeddings."""
         try:
             # Generate embedding for the query
-            query_embedding = embedding_service.generate_single_embedding(query)
-            query_embedding_list = query_embedding.tolist()
+            # (run in a worker thread so the event loop stays responsive)
+            query_embedding = await asyncio.to_thread(
+                embedding_service.generate_single_embedding, query
+            )
+            # FAISS fast-path: exact inner-product search over the mirrored
+            # embeddings (metadata filters still go through ChromaDB)
+            if (
+                self._faiss_index is not None
+                and where is None
+                and self._faiss_index.ntotal > 0
+            ):
+                search_results = await asyncio.to_thread(
+                    self._search_faiss, query_embedding, n_results
+                )
+                logger.info(
+                    f"Found {len(search_results)} similar documents using FAISS"
+                )
+                return search_results
 
-            results = self.collection.query(
-                query_embeddings=[query_embedding_list],
+            results = await asyncio.to_thread(
+                self.collection.query,
+                query_embeddings=query_embedding.reshape(1, -1),
                 n_results=n_results,
                 where=where,
             )
@@ -207,23 +442,15 @@ class ChromaRepository(DocumentRepository, RAGRepository):
                     distance = (
                         results["distances"][0][i] if results["distances"] else 0.0
                     )
-                    # Convert cosine distance to cosine similarity
-                    # Distance: 0 (identical) → 2 (opposite)
-                    # Similarity: 1 (identical) → -1 (opposite)
-                    # Normalize distance to 0-1 range, then convert to similarity
-                    normalized_distance = min(
-                        distance / 2.0, 1.0
-                    )  # Distance'ı 0-1 aralığına normalize et
-                    similarity_score = (
-                        1.0 - normalized_distance
-                    )  # Similarity = 1 - normalized_distance
-                    similarity_score = max(
-                        0.0, min(1.0, similarity_score)
-                    )  # 0-1 aralığında sınırla
+                    # The collection uses cosine space, so distance is
+                    # 1 - cosine_similarity; invert it and clamp to 0-1
+                    # the same way the FAISS fast-path does, so both
+                    # search paths score on the same scale
+                    similarity_score = max(0.0, min(1.0, 1.0 - distance))
 
                     # Debug logging
                     logger.info(
-                        f"Distance: {distance:.4f}, Normalized: {normalized_distance:.4f}, Similarity: {similarity_score:.4f}"
+                        f"Distance: {distance:.4f}, Similarity: {similarity_score:.4f}"
                     )
 
                     search_result = SearchResult(
@@ -239,12 +466,33 @@ class ChromaRepository(DocumentRepository, RAGRepository):
             logger.error(f"Error searching documents: {e}")
             raise
 
+    async def _document_exists(self, document_id: str) -> bool:
+        """Check whether a document exists, using the ID set as a fast-path.
+
+        Membership in the set short-circuits; a miss still asks ChromaDB,
+        because the set only tracks this process's view, and a hit there
+        repairs the set.
+        """
+        if self._known_ids is not None and document_id in self._known_ids:
+            return True
+
+        results = await asyncio.to_thread(
+            self.collection.get, ids=[document_id], include=[]
+        )
+        if results["ids"]:
+            if self._known_ids is not None:
+                self._known_ids.add(document_id)
+            return True
+        return False
+
     async def get_document(self, document_id: str) -> Optional[Document]:
         """Get a specific document by ID."""
         try:
-            results = self.collection.get(ids=[document_id])
+            results = await asyncio.to_thread(self.collection.get, ids=[document_id])
 
             if results["documents"] and results["documents"][0]:
+                if self._known_ids is not None:
+                    self._known_ids.add(document_id)
                 return Document(
                     id=results["ids"][0],
                     content=results["documents"][0],
@@ -260,12 +508,32 @@ class ChromaRepository(DocumentRepository, RAGRepository):
     ) -> bool:
         """Update a document."""
         try:
-            update_data = {"ids": [document_id], "documents": [document]}
+            if not await self._document_exists(document_id):
+                return False
+
+            # Embed the new content with the service; without an explicit
+            # embedding, collection.update recomputes the vector with
+            # Chroma's default embedding function and the stored vector
+            # diverges from the rest of the collection
+            embedding = await asyncio.to_thread(
+                embedding_service.generate_single_embedding, document
+            )
+
+            update_data = {
+                "ids": [document_id],
+                "documents": [document],
+                "embeddings": embedding.reshape(1, -1),
+            }
 
             if metadata:
                 update_data["metadatas"] = [metadata]
 
-            self.collection.update(**update_data)
+            await asyncio.to_thread(self.collection.update, **update_data)
+            self._doc_cache.pop(document_id, None)
+            # Rebuild the FAISS mirror so search ranks the new content
+            # instead of the pre-update vector
+            if self._faiss_index is not None:
+                await asyncio.to_thread(self._build_faiss_index)
             logger.info(f"Updated document {document_id}")
             return True
         except Exception as e:
@@ -275,7 +543,16 @@ class ChromaRepository(DocumentRepository, RAGRepository):
     async def delete_document(self, document_id: str) -> bool:
         """Delete a document."""
         try:
-            self.collection.delete(ids=[document_id])
+            if not await self._document_exists(document_id):
+                return False
+
+            await asyncio.to_thread(self.collection.delete, ids=[document_id])
+            if self._known_ids is not None:
+                self._known_ids.discard(document_id)
+            self._doc_cache.pop(document_id, None)
+            # Rebuild the FAISS mirror so it does not serve stale entries
+            if self._faiss_index is not None:
+                await asyncio.to_thread(self._build_faiss_index)
             logger.info(f"Deleted document {document_id}")
             return True
         except Exception as e:
@@ -285,7 +562,7 @@ class ChromaRepository(DocumentRepository, RAGRepository):
     async def get_collection_stats(self) -> CollectionStats:
         """Get collection statistics."""
         try:
-            count = self.collection.count()
+            count = await asyncio.to_thread(self.collection.count)
             return CollectionStats(
                 total_documents=count,
                 collection_name=self.collection_name,
@@ -299,44 +576,15 @@ class ChromaRepository(DocumentRepository, RAGRepository):
                 last_updated=datetime.utcnow(),
             )
 
-    async def list_documents(self) -> List[Dict[str, Any]]:
-        """List all documents with their IDs and metadata."""
-        try:
-            # Get all documents from the collection
-            results = self.collection.get()
-
-            documents = []
-            if results["ids"]:
-                for i, doc_id in enumerate(results["ids"]):
-                    document_info = {
-                        "id": doc_id,
-                        "metadata": (
-                            results["metadatas"][i]
-                            if results["metadatas"] and i < len(results["metadatas"])
-                            else {}
-                        ),
-                    }
-                    # Include a preview of the document content (first 100 characters)
-                    if results["documents"] and i < len(results["documents"]):
-                        content = results["documents"][i]
-                        document_info["content_preview"] = (
-                            content[:100] + "..." if len(content) > 100 else content
-                        )
-                        document_info["content_length"] = len(content)
-
-                    documents.append(document_info)
-
-            logger.info(f"Listed {len(documents)} documents")
-            return documents
-        except Exception as e:
-            logger.error(f"Error listing documents: {e}")
-            raise
-
     async def reset_collection(self) -> bool:
         """Reset the collection (delete all documents)."""
         try:
             self.client.delete_collection(name=self.collection_name)
             self.collection = self._get_or_create_collection()
+            self._doc_cache.clear()
+            self._load_known_ids()
+            if self._faiss_index is not None:
+                self._build_faiss_index()
             logger.info(f"Reset collection {self.collection_name}")
             return True
         except Exception as e:
@@ -347,7 +595,7 @@ class ChromaRepository(DocumentRepository, RAGRepository):
         """List all documents with their IDs and metadata."""
         try:
             # Get all documents from the collection
-            results = self.collection.get()
+            results = await asyncio.to_thread(self.collection.get)
 
             documents = []
             if results["ids"]:
@@ -388,16 +636,21 @@ class ChromaRepository(DocumentRepository, RAGRepository):
                 )
 
             # Filter results by similarity threshold
+            # Build the context incrementally in a StringIO buffer so large
+            # contexts avoid the intermediate list + join string copies
             relevant_docs = []
-            context_parts = []
+            context_buffer = io.StringIO()
+            context_size = 0
 
             for result in search_results:
                 logger.info(
                     f"Evaluating result: similarity={result.similarity_score:.4f}, threshold={similarity_threshold:.4f}"
                 )
                 if result.similarity_score >= similarity_threshold:
+                    if relevant_docs:
+                        context_size += context_buffer.write("\n\n")
+                    context_size += context_buffer.write(result.document.content)
                     relevant_docs.append(result.document)
-                    context_parts.append(result.document.content)
                     logger.info(
                         f"Result included: similarity={result.similarity_score:.4f} >= threshold={similarity_threshold:.4f}"
                     )
@@ -407,11 +660,11 @@ class ChromaRepository(DocumentRepository, RAGRepository):
                     )
 
             # Combine context
-            rag_context = "\n\n".join(context_parts)
+            rag_context = context_buffer.getvalue()
 
             logger.info(
                 f"RAG context: {len(relevant_docs)}/{len(search_results)} docs, "
-                f"{len(rag_context)} characters"
+                f"{context_size} characters"
             )
 
             return RAGContext(
@@ -1,5 +1,7 @@
+from functools import cached_property
 from typing import List, Optional, Union
 import numpy as np
+import torch
 from sentence_transformers import SentenceTransformer
 from app.core.config import settings
 from app.core.exceptions import EmbeddingError
@@ -28,7 +30,50 @@ class EmbeddingService:
         """Initialize the sentence transformer model."""
         try:
             logger.info(f"Loading embedding model: {self.model_name}")
-            self.model = SentenceTransformer(self.model_name, device=self.device)
+            # Allow TF32 matmuls on Ampere+ GPUs; no-op on CPU
+            torch.set_float32_matmul_precision("high")
+            # Prefer mmap-able safetensors weights and stream tensors into
+            # place instead of materializing a full state-dict copy first
+            try:
+                self.model = SentenceTransformer(
+                    self.model_name,
+                    device=self.device,
+                    model_kwargs={
+                        "use_safetensors": True,
+                        "low_cpu_mem_usage": True,
+                    },
+                )
+            except Exception as load_error:
+                # low_cpu_mem_usage needs accelerate and not every model
+                # ships safetensors; fall back to the plain load path
+                logger.warning(
+                    f"Fast weight loading unavailable, using default load: {load_error}"
+                )
+                self.model = SentenceTransformer(self.model_name, device=self.device)
+            if settings.EMBEDDING_USE_BF16:
+                try:
+                    # Halves activation bandwidth; outputs are cast back to
+                    # float32 in generate_embeddings before storage
+                    self.model = self.model.to(torch.bfloat16)
+                    logger.info("Embedding model cast to bfloat16")
+                except Exception as cast_error:
+                    logger.warning(
+                        f"bfloat16 cast failed, keeping float32: {cast_error}"
+                    )
+            if settings.COMPILE_EMBEDDINGS:
+                try:
+                    # Fuse the transformer forward; the first encode pays
+                    # the compile, every later call runs the fused graph
+                    self.model[0].auto_model = torch.compile(
+                        self.model[0].auto_model,
+                        mode="reduce-overhead",
+                        dynamic=True,
+                    )
+                    logger.info("Embedding model compiled with torch.compile")
+                except Exception as compile_error:
+                    logger.warning(
+                        f"torch.compile failed, using eager model: {compile_error}"
+                    )
             logger.info(f"Embedding model loaded successfully on {self.device}")
         except Exception as e:
             logger.error(f"Failed to load embedding model: {e}")
@@ -63,16 +108,19 @@ class EmbeddingService:
             )
 
         try:
-            # Generate embeddings
+            # Generate embeddings in a single batched encode call; the model
+            # sorts inputs by length internally to minimize padding waste
             embeddings = self.model.encode(
                 texts,
                 batch_size=effective_batch_size,
-                show_progress_bar=len(texts) > 10,
+                show_progress_bar=False,
                 convert_to_numpy=True,
             )
 
             logger.info(f"Generated embeddings for {len(texts)} texts")
-            return embeddings
+            # Hand back one contiguous float32 array; Chroma and FAISS can
+            # consume it without per-row conversion
+            return np.ascontiguousarray(embeddings, dtype=np.float32)
 
         except Exception as e:
             logger.error(f"Error generating embeddings: {e}")
@@ -125,6 +173,17 @@ class EmbeddingService:
                 },
             )
 
+    @cached_property
+    def _model_info(self) -> dict:
+        """Static model facts, computed once per loaded model."""
+        return {
+            "model_name": self.model_name,
+            "device": self.device,
+            "loaded": True,
+            "embedding_dimension": self.get_embedding_dimension(),
+            "batch_size": self.batch_size,
+        }
+
     def get_model_info(self) -> dict:
         """Get information about the current model."""
         if self.model is None:
@@ -134,13 +193,7 @@ class EmbeddingService:
                 "loaded": False,
             }
 
-        return {
-            "model_name": self.model_name,
-            "device": self.device,
-            "loaded": True,
-            "embedding_dimension": self.get_embedding_dimension(),
-            "batch_size": self.batch_size,
-        }
+        return self._model_info
 
     def reload_model(self, model_name: Optional[str] = None):
         """Reload the model with a new model name."""
@@ -148,6 +201,8 @@ class EmbeddingService:
             if model_name:
                 self.model_name = model_name
             self._initialize_model()
+            # Drop the memoized info; the new model may differ
+            self.__dict__.pop("_model_info", None)
         except Exception as e:
             logger.error(f"Failed to reload model: {e}")
             raise EmbeddingError(
@@ -161,6 +216,8 @@ class EmbeddingService:
             if self.model is not None:
                 self.model = self.model.to(device)
             self.device = device
+            # Drop the memoized info; it records the device
+            self.__dict__.pop("_model_info", None)
             logger.info(f"Model moved to device: {device}")
         except Exception as e:
             logger.error(f"Failed to change device to {device}: {e}")
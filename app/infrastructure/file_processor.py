@@ -1,6 +1,7 @@
+import asyncio
 import io
 import logging
-from typing import Dict, Any, Optional, List
+from typing import BinaryIO, Dict, Any, Optional, List, Union
 from pathlib import Path
 import mimetypes
 
@@ -70,6 +71,13 @@ class FileProcessor:
     def __init__(self):
         """Initialize the file processor."""
         self.supported_types = list(self.SUPPORTED_EXTENSIONS.keys())
+        # Static capability table, computed once instead of per request
+        self.info = {
+            "supported_extensions": self.supported_types,
+            "max_file_size_mb": self.MAX_FILE_SIZE / (1024 * 1024),
+            "supported_mime_types": list(self.SUPPORTED_EXTENSIONS.values()),
+            "max_image_size_mb": self.MAX_IMAGE_SIZE / (1024 * 1024),
+        }
 
     def is_supported_file(self, filename: str) -> bool:
         """Check if file type is supported."""
@@ -86,8 +94,26 @@ class FileProcessor:
         max_size = self.MAX_IMAGE_SIZE if is_image else self.MAX_FILE_SIZE
         return file_size <= max_size
 
-    async def process_file(self, file_content: bytes, filename: str) -> Dict[str, Any]:
-        """Process a file and extract text content."""
+    def _open_stream(self, file_content: Union[bytes, BinaryIO]) -> BinaryIO:
+        """Get a readable binary stream for the given content."""
+        if isinstance(file_content, bytes):
+            return io.BytesIO(file_content)
+        file_content.seek(0)
+        return file_content
+
+    def _content_size(self, file_content: Union[bytes, BinaryIO]) -> int:
+        """Get the size in bytes of the given content."""
+        if isinstance(file_content, bytes):
+            return len(file_content)
+        file_content.seek(0, io.SEEK_END)
+        size = file_content.tell()
+        file_content.seek(0)
+        return size
+
+    async def process_file(
+        self, file_content: Union[bytes, BinaryIO], filename: str
+    ) -> Dict[str, Any]:
+        """Process a file (bytes or spooled stream) and extract text content."""
         try:
             file_ext = Path(filename).suffix.lower()
 
@@ -95,7 +121,7 @@ class FileProcessor:
                 raise ValueError(f"Unsupported file type: {file_ext}")
 
             # Check file size
-            file_size = len(file_content)
+            file_size = self._content_size(file_content)
             is_image = file_ext in [".png", ".jpg", ".jpeg", ".gif", ".bmp", ".tiff"]
             if not self.validate_file_size(file_size, is_image):
                 max_size = self.MAX_IMAGE_SIZE if is_image else self.MAX_FILE_SIZE
@@ -103,8 +129,11 @@ class FileProcessor:
                     f"File too large. Max size: {max_size / (1024*1024):.1f}MB"
                 )
 
-            # Extract text based on file type
-            text_content = await self._extract_text(file_content, file_ext)
+            # Extract text based on file type (CPU-bound, run in a worker
+            # thread so concurrent files actually overlap)
+            text_content = await asyncio.to_thread(
+                self._extract_text, file_content, file_ext
+            )
 
             # Create metadata
             metadata = {
@@ -129,21 +158,23 @@ class FileProcessor:
                 "success": False,
             }
 
-    async def _extract_text(self, file_content: bytes, file_ext: str) -> str:
+    def _extract_text(
+        self, file_content: Union[bytes, BinaryIO], file_ext: str
+    ) -> str:
         """Extract text content from file based on type."""
         try:
             if file_ext == ".pdf":
-                return await self._extract_pdf_text(file_content)
+                return self._extract_pdf_text(file_content)
             elif file_ext in [".docx"]:
-                return await self._extract_docx_text(file_content)
+                return self._extract_docx_text(file_content)
             elif file_ext in [".txt"]:
-                return file_content.decode("utf-8")
+                return self._open_stream(file_content).read().decode("utf-8")
             elif file_ext in [".xlsx", ".xls"]:
-                return await self._extract_excel_text(file_content)
+                return self._extract_excel_text(file_content)
             elif file_ext in [".pptx", ".ppt"]:
-                return await self._extract_powerpoint_text(file_content)
+                return self._extract_powerpoint_text(file_content)
             elif file_ext in [".png", ".jpg", ".jpeg", ".gif", ".bmp", ".tiff"]:
-                return await self._extract_image_text(file_content)
+                return self._extract_image_text(file_content)
             else:
                 raise ValueError(f"Unsupported file type: {file_ext}")
 
@@ -151,13 +182,13 @@ class FileProcessor:
             logger.error(f"Error extracting text from {file_ext}: {e}")
             raise
 
-    async def _extract_pdf_text(self, file_content: bytes) -> str:
+    def _extract_pdf_text(self, file_content: Union[bytes, BinaryIO]) -> str:
         """Extract text from PDF file."""
         if not PDF_AVAILABLE:
             raise ValueError("PDF processing not available. Install pypdf package.")
 
         try:
-            pdf_file = io.BytesIO(file_content)
+            pdf_file = self._open_stream(file_content)
             pdf_reader = pypdf.PdfReader(pdf_file)
 
             text_parts = []
@@ -171,7 +202,7 @@ class FileProcessor:
             logger.error(f"Error extracting PDF text: {e}")
             raise
 
-    async def _extract_docx_text(self, file_content: bytes) -> str:
+    def _extract_docx_text(self, file_content: Union[bytes, BinaryIO]) -> str:
         """Extract text from DOCX file."""
         if not DOCX_AVAILABLE:
             raise ValueError(
@@ -179,7 +210,7 @@ class FileProcessor:
             )
 
         try:
-            doc_file = io.BytesIO(file_content)
+            doc_file = self._open_stream(file_content)
             doc = Document(doc_file)
 
             text_parts = []
@@ -192,7 +223,7 @@ class FileProcessor:
             logger.error(f"Error extracting DOCX text: {e}")
             raise
 
-    async def _extract_excel_text(self, file_content: bytes) -> str:
+    def _extract_excel_text(self, file_content: Union[bytes, BinaryIO]) -> str:
         """Extract text from Excel file."""
         if not EXCEL_AVAILABLE:
             raise ValueError(
@@ -200,7 +231,7 @@ class FileProcessor:
             )
 
         try:
-            excel_file = io.BytesIO(file_content)
+            excel_file = self._open_stream(file_content)
             workbook = openpyxl.load_workbook(excel_file)
 
             text_parts = []
@@ -224,7 +255,9 @@ class FileProcessor:
             logger.error(f"Error extracting Excel text: {e}")
             raise
 
-    async def _extract_powerpoint_text(self, file_content: bytes) -> str:
+    def _extract_powerpoint_text(
+        self, file_content: Union[bytes, BinaryIO]
+    ) -> str:
         """Extract text from PowerPoint file."""
         if not PPTX_AVAILABLE:
             raise ValueError(
@@ -232,7 +265,7 @@ class FileProcessor:
             )
 
         try:
-            ppt_file = io.BytesIO(file_content)
+            ppt_file = self._open_stream(file_content)
             presentation = Presentation(ppt_file)
 
             text_parts = []
@@ -250,7 +283,7 @@ class FileProcessor:
             logger.error(f"Error extracting PowerPoint text: {e}")
             raise
 
-    async def _extract_image_text(self, file_content: bytes) -> str:
+    def _extract_image_text(self, file_content: Union[bytes, BinaryIO]) -> str:
         """Extract text from image using OCR."""
         if not OCR_AVAILABLE:
             raise ValueError(
@@ -258,7 +291,7 @@ class FileProcessor:
             )
 
         try:
-            image = Image.open(io.BytesIO(file_content))
+            image = Image.open(self._open_stream(file_content))
 
             # Convert to RGB if necessary
             if image.mode != "RGB":
@@ -278,13 +311,12 @@ class FileProcessor:
         return datetime.now().isoformat()
 
     async def process_multiple_files(
-        self, files: List[Dict[str, Any]]
+        self, filenames: List[str], contents: List[Union[bytes, BinaryIO]]
     ) -> List[Dict[str, Any]]:
-        """Process multiple files."""
-        results = []
-        for file_data in files:
-            result = await self.process_file(
-                file_data["content"], file_data["filename"]
-            )
-            results.append(result)
-        return results
+        """Process multiple files concurrently."""
+        return await asyncio.gather(
+            *[
+                self.process_file(content, filename)
+                for filename, content in zip(filenames, contents)
+            ]
+        )
@@ -1,3 +1,5 @@
+import asyncio
+
 import google.generativeai as genai
 from typing import Optional, List, Dict, Any
 from app.core.config import settings
@@ -35,6 +37,26 @@ class GeminiAdapter:
                 reason=f"Failed to initialize model '{self.model_name}': {str(e)}",
             )
 
+    async def warmup(self) -> bool:
+        """Warm up the Gemini HTTP connection at application startup.
+
+        Issues a cheap `count_tokens` call so DNS resolution and the TLS
+        handshake happen before the first real request; the SDK keeps the
+        underlying connection pooled afterwards.
+        """
+        if self.model is None:
+            logger.warning("Gemini model not initialized, skipping warmup")
+            return False
+
+        try:
+            await asyncio.to_thread(self.model.count_tokens, "warmup")
+            logger.info("Gemini connection warmed up successfully")
+            return True
+        except Exception as e:
+            # Warmup is best-effort; a failure here must not block startup
+            logger.warning(f"Gemini warmup failed: {e}")
+            return False
+
     async def generate_response(
         self,
         prompt: str,
@@ -1,4 +1,5 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Response
+from fastapi.responses import ORJSONResponse
 from typing import Dict, Any
 
 from app.application.use_cases import DocumentUseCase
@@ -8,17 +9,26 @@ from app.core.exceptions import RAGBaseException
 from app.core.logging import get_logger
 from app.core.dependencies import get_document_use_case
 from app.presentation.chat.dto import (
+    MSGSPEC_AVAILABLE,
     ChatRequest,
     ChatResponse,
+    SourceItem,
 )
 
+if MSGSPEC_AVAILABLE:
+    import msgspec
+
 logger = get_logger(__name__)
 
 # Create router
-router = APIRouter(prefix="/chat", tags=["chat"])
+router = APIRouter(
+    prefix="/chat", tags=["chat"], default_response_class=ORJSONResponse
+)
 
 
-@router.post("/", response_model=ChatResponse)
+# No response_model: the response is encoded with msgspec when available,
+# so FastAPI must not re-validate/re-serialize it
+@router.post("/")
 async def chat_with_ai(
     request: ChatRequest,
     document_use_case: DocumentUseCase = Depends(get_document_use_case),
@@ -39,16 +49,17 @@ async def chat_with_ai(
             )
 
             rag_context = rag_result.context
+            source_factory = SourceItem if MSGSPEC_AVAILABLE else dict
             sources = [
-                {
-                    "document": (
+                source_factory(
+                    document=(
                         doc.content[: settings.RAG_DOCUMENT_PREVIEW_LENGTH] + "..."
                         if len(doc.content) > settings.RAG_DOCUMENT_PREVIEW_LENGTH
                         else doc.content
                     ),
-                    "score": 1.0,  # We could calculate this from similarity if needed
-                    "metadata": doc.metadata,
-                }
+                    score=1.0,  # We could calculate this from similarity if needed
+                    metadata=doc.metadata,
+                )
                 for doc in rag_result.sources
             ]
 
@@ -72,6 +83,18 @@ async def chat_with_ai(
             response = await gemini_adapter.generate_response(request.message)
 
         logger.info("Response generated successfully")
+        if MSGSPEC_AVAILABLE:
+            return Response(
+                content=msgspec.json.encode(
+                    {
+                        "response": response,
+                        "sources": sources if sources else None,
+                        "rag_used": bool(rag_context),
+                    }
+                ),
+                media_type="application/json",
+            )
+
         return ChatResponse(
             response=response,
             sources=sources if sources else None,
@@ -1,6 +1,14 @@
 from typing import Optional, List, Dict, Any
 from pydantic import BaseModel
 
+# msgspec is an optional dependency for fast response serialization
+try:
+    import msgspec
+
+    MSGSPEC_AVAILABLE = True
+except ImportError:
+    MSGSPEC_AVAILABLE = False
+
 
 # Chat DTOs
 class ChatRequest(BaseModel):
@@ -18,6 +26,19 @@ class ChatRequest(BaseModel):
         }
 
 
+if MSGSPEC_AVAILABLE:
+
+    class SourceItem(msgspec.Struct):
+        """Source document entry in a chat response (msgspec fast path)."""
+
+        document: str
+        score: float
+        metadata: Dict[str, Any]
+
+else:
+    SourceItem = None
+
+
 class ChatResponse(BaseModel):
     response: str
     sources: Optional[List[Dict[str, Any]]] = None
@@ -1,15 +1,44 @@
-from fastapi import APIRouter, HTTPException, status, UploadFile, File, Form, Depends
-from typing import Optional, List, Dict, Any
+import asyncio
+import base64
+import struct
+import tempfile
+from functools import lru_cache
+
+import numpy as np
+import orjson
+from fastapi import (
+    APIRouter,
+    HTTPException,
+    Response,
+    status,
+    UploadFile,
+    File,
+    Form,
+    Depends,
+)
+from fastapi.responses import ORJSONResponse
+from typing import BinaryIO, Optional, List, Dict, Any
 
 from app.application.use_cases import DocumentUseCase, FILE_PROCESSOR_AVAILABLE
 from app.infrastructure.file_processor import FileProcessor
 from app.infrastructure.embedding_service import embedding_service
+from app.core.config import settings
 from app.core.logging import get_logger
 from app.core.dependencies import get_document_use_case, get_file_processor
 from app.presentation.documents.dto import (
     DocumentRequest,
     DocumentUpdateRequest,
+    validated_document_request,
+    validated_document_update_request,
 )
+# msgspec is an optional dependency for the msgpack metadata envelope
+try:
+    import msgspec
+
+    MSGSPEC_AVAILABLE = True
+except ImportError:
+    MSGSPEC_AVAILABLE = False
+
 from app.core.exceptions import (
     DocumentNotFoundError,
     DocumentProcessingError,
@@ -19,17 +48,105 @@ from app.core.exceptions import (
     ValidationError,
 )
 
-# Create router
-router = APIRouter(prefix="/documents", tags=["documents"])
+# Create router (orjson handles the large list/search/embedding responses)
+router = APIRouter(
+    prefix="/documents", tags=["documents"], default_response_class=ORJSONResponse
+)
 
 # Initialize dependencies
 logger = get_logger(__name__)
 
+# Chunk size for streaming uploads to the spooled buffer
+UPLOAD_CHUNK_SIZE = 1024 * 1024  # 1MB
+
+# Cached (preview, length) per document ID so list_documents does not
+# re-slice every document body on every call. Keyed on content length
+# rather than updated_at: list_documents rebuilds Document objects per
+# call, so __post_init__ restamps updated_at and it never compares equal.
+# LRUCache bounds the entries (IDs removed by reset_collection age out).
+try:
+    from cachetools import LRUCache
+
+    _preview_cache: Dict[str, Any] = LRUCache(maxsize=4096)
+except ImportError:
+    _preview_cache = {}
+_PREVIEW_CACHE_MAX = 4096
+
+
+def _content_preview(doc) -> tuple:
+    """Get the cached content preview and length for a document."""
+    length = len(doc.content)
+    cached = _preview_cache.get(doc.id)
+    if cached is not None and cached[1] == length:
+        return cached
+
+    preview = doc.content[:100] + "..." if length > 100 else doc.content
+    if type(_preview_cache) is dict and len(_preview_cache) >= _PREVIEW_CACHE_MAX:
+        # Fallback store without LRU semantics: drop the oldest entry
+        _preview_cache.pop(next(iter(_preview_cache)))
+    _preview_cache[doc.id] = (preview, length)
+    return preview, length
+
+
+async def _spool_upload(file: UploadFile, file_processor: FileProcessor) -> BinaryIO:
+    """Stream an upload into a spooled temp buffer, enforcing the size cap.
+
+    Reads the upload in chunks instead of slurping it into one bytes object,
+    so oversized payloads are rejected as soon as the cap is crossed and
+    large files spill to disk instead of staying in RAM.
+    """
+    # Short-circuit on the declared size (from the Content-Length of the
+    # multipart part) before reading anything; the mid-stream check below
+    # still guards against clients that lie about the size
+    if file.size is not None and not file_processor.validate_file_size(file.size):
+        raise FileSizeExceededError(
+            file.filename, file.size, file_processor.MAX_FILE_SIZE
+        )
+
+    spool = tempfile.SpooledTemporaryFile(max_size=UPLOAD_CHUNK_SIZE)
+    total_size = 0
+    try:
+        while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+            total_size += len(chunk)
+            if not file_processor.validate_file_size(total_size):
+                raise FileSizeExceededError(
+                    file.filename, total_size, file_processor.MAX_FILE_SIZE
+                )
+            spool.write(chunk)
+    except Exception:
+        spool.close()
+        raise
+
+    spool.seek(0)
+    return spool
+
+
+@lru_cache(maxsize=1024)
+def _parse_metadatas_json(raw: str):
+    """Parse a metadatas JSON blob, cached by the raw string.
+
+    Bulk ingestion clients tend to repeat the same metadata across many
+    calls, so identical blobs skip the re-decode. Returns None for
+    invalid JSON. Callers must not mutate the returned value.
+    """
+    try:
+        return orjson.loads(raw)
+    except orjson.JSONDecodeError:
+        return None
+
+
+def _decode_msgpack_form(value: str, field: str):
+    """Decode a base64+msgpack form field into Python objects."""
+    try:
+        return msgspec.msgpack.decode(base64.b64decode(value))
+    except Exception:
+        raise ValidationError(field, "Invalid base64+msgpack payload")
+
 
 # Document Management Endpoints
 @router.post("/", response_model=Dict[str, Any])
 async def add_documents(
-    request: DocumentRequest,
+    request: DocumentRequest = Depends(validated_document_request),
     document_use_case: DocumentUseCase = Depends(get_document_use_case),
 ):
     """Add documents to the knowledge base.
@@ -59,11 +176,9 @@ async def search_documents(
     # Parse where parameter if provided
     where_dict = None
     if where:
-        import json
-
         try:
-            where_dict = json.loads(where)
-        except json.JSONDecodeError:
+            where_dict = orjson.loads(where)
+        except orjson.JSONDecodeError:
             raise ValidationError("where", "Invalid JSON format")
 
     results = await document_use_case.search_documents(query, n_results, where_dict)
@@ -81,23 +196,28 @@ async def search_documents(
     ]
 
 
-@router.get("/supported-types", response_model=Dict[str, Any])
+# Serialized supported-types payload; the content is constant for the
+# process lifetime, so it is built and encoded exactly once
+_supported_types_bytes: Optional[bytes] = None
+
+
+@router.get("/supported-types")
 async def get_supported_file_types(
     file_processor: FileProcessor = Depends(get_file_processor),
 ):
     """Get list of supported file types."""
-    response = {
-        "supported_extensions": file_processor.supported_types,
-        "max_file_size_mb": file_processor.MAX_FILE_SIZE / (1024 * 1024),
-        "supported_mime_types": list(file_processor.SUPPORTED_EXTENSIONS.values()),
-        "full_processor_available": FILE_PROCESSOR_AVAILABLE,
-    }
-
-    # Add image size limit only if full processor is available
-    if FILE_PROCESSOR_AVAILABLE and hasattr(file_processor, "MAX_IMAGE_SIZE"):
-        response["max_image_size_mb"] = file_processor.MAX_IMAGE_SIZE / (1024 * 1024)
+    global _supported_types_bytes
+    if _supported_types_bytes is None:
+        # The capability table is precomputed on the processor; no
+        # per-request hasattr branching or arithmetic needed
+        _supported_types_bytes = orjson.dumps(
+            {
+                **file_processor.info,
+                "full_processor_available": FILE_PROCESSOR_AVAILABLE,
+            }
+        )
 
-    return response
+    return Response(content=_supported_types_bytes, media_type="application/json")
 
 
 @router.get("/stats", response_model=Dict[str, Any])
@@ -121,19 +241,20 @@ async def list_documents(
     documents = await document_use_case.list_documents()
 
     # Convert Document entities to dictionaries for API response
-    return [
-        {
-            "id": doc.id,
-            "content_preview": (
-                doc.content[:100] + "..." if len(doc.content) > 100 else doc.content
-            ),
-            "content_length": len(doc.content),
-            "metadata": doc.metadata,
-            "created_at": doc.created_at.isoformat() if doc.created_at else None,
-            "updated_at": doc.updated_at.isoformat() if doc.updated_at else None,
-        }
-        for doc in documents
-    ]
+    response = []
+    for doc in documents:
+        preview, length = _content_preview(doc)
+        response.append(
+            {
+                "id": doc.id,
+                "content_preview": preview,
+                "content_length": length,
+                "metadata": doc.metadata,
+                "created_at": doc.created_at.isoformat() if doc.created_at else None,
+                "updated_at": doc.updated_at.isoformat() if doc.updated_at else None,
+            }
+        )
+    return response
 
 
 @router.get("/{document_id}", response_model=Dict[str, Any])
@@ -157,7 +278,7 @@ async def get_document(
 @router.put("/{document_id}", response_model=Dict[str, Any])
 async def update_document(
     document_id: str,
-    request: DocumentUpdateRequest,
+    request: DocumentUpdateRequest = Depends(validated_document_update_request),
     document_use_case: DocumentUseCase = Depends(get_document_use_case),
 ):
     """Update a document."""
@@ -166,6 +287,7 @@ async def update_document(
     )
     if not success:
         raise DocumentNotFoundError(document_id)
+    _preview_cache.pop(document_id, None)
     return {"message": "Document updated successfully", "document_id": document_id}
 
 
@@ -178,6 +300,7 @@ async def delete_document(
     success = await document_use_case.delete_document(document_id)
     if not success:
         raise DocumentNotFoundError(document_id)
+    _preview_cache.pop(document_id, None)
     return {"message": "Document deleted successfully", "document_id": document_id}
 
 
@@ -198,19 +321,60 @@ async def get_embedding_info():
     return embedding_service.get_model_info()
 
 
-@router.post("/embeddings/generate", response_model=Dict[str, Any])
+@router.post("/embeddings/generate")
 async def generate_embeddings(texts: List[str]):
     """Generate embeddings for given texts."""
     if not texts:
         raise ValidationError("texts", "No texts provided")
 
     try:
-        embeddings = embedding_service.generate_embeddings(texts)
-        return {
-            "embeddings": [embedding.tolist() for embedding in embeddings],
-            "count": len(embeddings),
-            "dimension": len(embeddings[0]) if len(embeddings) > 0 else 0,
-        }
+        embeddings = await asyncio.to_thread(
+            embedding_service.generate_embeddings, texts
+        )
+        # orjson serializes the ndarray directly (OPT_SERIALIZE_NUMPY),
+        # avoiding the N*D Python float boxing of embedding.tolist()
+        return ORJSONResponse(
+            content={
+                "embeddings": embeddings,
+                "count": len(embeddings),
+                "dimension": embeddings.shape[1] if len(embeddings) > 0 else 0,
+            }
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error generating embeddings: {str(e)}",
+        )
+
+
+# Dtype code in the raw embeddings header (currently only float16)
+RAW_EMBEDDING_DTYPE_FLOAT16 = 1
+
+
+@router.post("/embeddings/generate-raw")
+async def generate_embeddings_raw(texts: List[str]):
+    """Generate embeddings and return them as a raw float16 binary buffer.
+
+    The body is a 12-byte `<III` header (count, dimension, dtype code)
+    followed by the row-major float16 embedding matrix. Skips JSON
+    serialization entirely and halves the payload versus float32.
+    """
+    if not texts:
+        raise ValidationError("texts", "No texts provided")
+
+    try:
+        embeddings = await asyncio.to_thread(
+            embedding_service.generate_embeddings, texts
+        )
+        count = len(embeddings)
+        dimension = embeddings.shape[1] if count > 0 else 0
+        header = struct.pack(
+            "<III", count, dimension, RAW_EMBEDDING_DTYPE_FLOAT16
+        )
+        body = embeddings.astype(np.float16, copy=False).tobytes()
+        return Response(
+            content=header + body, media_type="application/octet-stream"
+        )
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -223,6 +387,8 @@ async def generate_embeddings(texts: List[str]):
 async def upload_single_file(
     file: UploadFile = File(...),
     metadata: Optional[str] = Form(None),
+    metadata_json: Optional[UploadFile] = File(None),
+    metadata_msgpack: Optional[str] = Form(None),
     document_use_case: DocumentUseCase = Depends(get_document_use_case),
     file_processor: FileProcessor = Depends(get_file_processor),
 ):
@@ -231,31 +397,37 @@ async def upload_single_file(
     if not file_processor.is_supported_file(file.filename):
         raise UnsupportedFileTypeError(file.filename, file_processor.supported_types)
 
-    # Read file content
-    file_content = await file.read()
-
-    # Validate file size
-    if not file_processor.validate_file_size(len(file_content)):
-        raise FileSizeExceededError(
-            file.filename, len(file_content), file_processor.MAX_FILE_SIZE
-        )
-
-    # Parse metadata if provided
+    # Parse metadata before spooling the file, so a rejected metadata part
+    # never leaves an open spool buffer behind. A JSON multipart part is
+    # preferred: it carries the bytes straight to orjson without the
+    # form-field string round-trip. The msgpack envelope and plain form
+    # field still work.
     file_metadata = None
-    if metadata:
-        import json
-
+    if metadata_json is not None:
+        try:
+            file_metadata = orjson.loads(await metadata_json.read())
+        except orjson.JSONDecodeError:
+            raise ValidationError("metadata_json", "Invalid JSON format")
+    elif metadata_msgpack and MSGSPEC_AVAILABLE:
+        file_metadata = _decode_msgpack_form(metadata_msgpack, "metadata_msgpack")
+    elif metadata:
         try:
             # Try to parse as JSON first
-            file_metadata = json.loads(metadata)
-        except json.JSONDecodeError:
+            file_metadata = orjson.loads(metadata)
+        except orjson.JSONDecodeError:
             # If not valid JSON, treat as simple string and create a basic metadata object
             file_metadata = {"source": metadata}
 
+    # Stream file content into a spooled buffer (size validated mid-stream)
+    file_content = await _spool_upload(file, file_processor)
+
     # Process and add file
-    result = await document_use_case.process_single_file(
-        file_content, file.filename, file_metadata
-    )
+    try:
+        result = await document_use_case.process_single_file(
+            file_content, file.filename, file_metadata
+        )
+    finally:
+        file_content.close()
 
     if not result["success"]:
         raise DocumentProcessingError(file.filename, result["error"])
@@ -273,53 +445,65 @@ async def upload_single_file(
 async def upload_multiple_files(
     files: List[UploadFile] = File(...),
     metadatas: Optional[str] = Form(None),
+    metadatas_json: Optional[UploadFile] = File(None),
+    metadatas_msgpack: Optional[str] = Form(None),
     document_use_case: DocumentUseCase = Depends(get_document_use_case),
     file_processor: FileProcessor = Depends(get_file_processor),
 ):
     """Upload multiple files and add them to the knowledge base."""
-    # Validate all files
-    for file in files:
+    # Parse metadatas before spooling any file, so a rejected metadata
+    # part never leaves open spool buffers behind. A JSON multipart part
+    # is preferred: it carries the bytes straight to orjson without the
+    # form-field string round-trip. The msgpack envelope and plain form
+    # field still work.
+    file_metadatas = None
+    if metadatas_json is not None:
+        try:
+            file_metadatas = orjson.loads(await metadatas_json.read())
+        except orjson.JSONDecodeError:
+            raise ValidationError("metadatas_json", "Invalid JSON format")
+    elif metadatas_msgpack and MSGSPEC_AVAILABLE:
+        file_metadatas = _decode_msgpack_form(metadatas_msgpack, "metadatas_msgpack")
+    elif metadatas:
+        file_metadatas = _parse_metadatas_json(metadatas)
+        if file_metadatas is None:
+            # If not valid JSON, create basic metadata for each file
+            file_metadatas = [{"source": f"file_{i}"} for i in range(len(files))]
+
+    # Read all files concurrently with bounded concurrency; type and size
+    # validation happen per file inside the reader, in a single pass
+    semaphore = asyncio.Semaphore(settings.UPLOAD_CONCURRENCY)
+
+    async def _read_one(file: UploadFile) -> BinaryIO:
         if not file_processor.is_supported_file(file.filename):
             raise UnsupportedFileTypeError(
                 file.filename, file_processor.supported_types
             )
+        async with semaphore:
+            return await _spool_upload(file, file_processor)
 
-    # Read all file contents
-    file_contents = []
-    for file in files:
-        content = await file.read()
-        if not file_processor.validate_file_size(len(content)):
-            raise FileSizeExceededError(
-                file.filename, len(content), file_processor.MAX_FILE_SIZE
-            )
-        file_contents.append(content)
+    results = await asyncio.gather(
+        *[_read_one(file) for file in files], return_exceptions=True
+    )
 
-    # Parse metadatas if provided
-    file_metadatas = None
-    if metadatas:
-        import json
+    errors = [result for result in results if isinstance(result, BaseException)]
+    if errors:
+        for result in results:
+            if not isinstance(result, BaseException):
+                result.close()
+        raise errors[0]
 
-        try:
-            file_metadatas = json.loads(metadatas)
-        except json.JSONDecodeError:
-            # If not valid JSON, create basic metadata for each file
-            file_metadatas = [{"source": f"file_{i}"} for i in range(len(files))]
+    file_contents = list(results)
 
-    # Prepare files for processing
-    files_data = []
-    for i, (file, content) in enumerate(zip(files, file_contents)):
-        files_data.append(
-            {
-                "filename": file.filename,
-                "content": content,
-                "metadata": (
-                    file_metadatas[i] if file_metadatas else {"source": f"file_{i}"}
-                ),
-            }
+    # Process and add files (parallel filename/content lists; no per-file
+    # dict construction needed on this path)
+    try:
+        result = await document_use_case.process_and_add_files(
+            [file.filename for file in files], file_contents, file_metadatas
         )
-
-    # Process and add files
-    result = await document_use_case.process_and_add_files(files_data, file_metadatas)
+    finally:
+        for content in file_contents:
+            content.close()
 
     return {
         "message": f"Processed {result['total_processed']} files",
@@ -1,6 +1,19 @@
 from typing import Optional, List, Dict, Any
+
+import orjson
+from fastapi import Request
 from pydantic import BaseModel
 
+from app.core.exceptions import ValidationError
+
+# fastjsonschema is an optional dependency for fast request validation
+try:
+    import fastjsonschema
+
+    FASTJSONSCHEMA_AVAILABLE = True
+except ImportError:
+    FASTJSONSCHEMA_AVAILABLE = False
+
 
 # Document Management DTOs
 class DocumentRequest(BaseModel):
@@ -27,3 +40,64 @@ class DocumentRequest(BaseModel):
 class DocumentUpdateRequest(BaseModel):
     document: str
     metadata: Optional[Dict[str, Any]] = None
+
+
+# Validators compiled once at import time; re-walking the pydantic schema
+# tree per request is the expensive part this avoids
+if FASTJSONSCHEMA_AVAILABLE:
+    _DOC_REQUEST_VALIDATOR = fastjsonschema.compile(
+        DocumentRequest.model_json_schema()
+    )
+    # Permissive passthrough for updates: metadata values are Dict[str,
+    # Any], so type-checking the value tree per request is pure overhead —
+    # but the container itself is still checked, because a string or list
+    # here would only fail later inside collection.update as a 500.
+    _DOC_UPDATE_VALIDATOR = fastjsonschema.compile(
+        {
+            "type": "object",
+            "required": ["document"],
+            "properties": {
+                "document": {"type": "string"},
+                "metadata": {"type": ["object", "null"]},
+            },
+        }
+    )
+
+
+async def _validated_body(request: Request, model, validator):
+    """Parse and validate a JSON body against a pre-compiled validator.
+
+    When fastjsonschema is available the compiled validator proves the
+    payload correct and `model_construct` skips pydantic's per-field
+    validation pipeline; otherwise the normal pydantic path is used.
+    """
+    try:
+        raw = orjson.loads(await request.body())
+    except orjson.JSONDecodeError:
+        raise ValidationError("body", "Invalid JSON format")
+
+    if validator is not None:
+        try:
+            validator(raw)
+        except fastjsonschema.JsonSchemaException as e:
+            raise ValidationError("body", e.message)
+        return model.model_construct(**raw)
+
+    try:
+        return model(**raw)
+    except Exception as e:
+        raise ValidationError("body", str(e))
+
+
+async def validated_document_request(request: Request) -> DocumentRequest:
+    """Dependency that validates a DocumentRequest body."""
+    validator = _DOC_REQUEST_VALIDATOR if FASTJSONSCHEMA_AVAILABLE else None
+    return await _validated_body(request, DocumentRequest, validator)
+
+
+async def validated_document_update_request(
+    request: Request,
+) -> DocumentUpdateRequest:
+    """Dependency that validates a DocumentUpdateRequest body."""
+    validator = _DOC_UPDATE_VALIDATOR if FASTJSONSCHEMA_AVAILABLE else None
+    return await _validated_body(request, DocumentUpdateRequest, validator)
@@ -3,7 +3,7 @@ Error handlers for the RAG system.
 """
 
 from fastapi import Request, HTTPException
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from fastapi.exceptions import RequestValidationError
 import logging
 import traceback
@@ -16,14 +16,14 @@ logger = logging.getLogger(__name__)
 
 async def rag_exception_handler(request: Request, exc: RAGBaseException):
     """Handle custom RAG exceptions."""
-    logger.error(f"RAG Exception: {exc.message} - {exc.details}")
+    logger.error("RAG Exception: %s - %s", exc.message, exc.details)
 
     error_content = {
         "error": {
             "type": exc.__class__.__name__,
             "message": exc.message,
             "details": exc.details,
-            "path": str(request.url.path),
+            "path": request.url.path,
         }
     }
 
@@ -32,14 +32,14 @@ async def rag_exception_handler(request: Request, exc: RAGBaseException):
 
 async def validation_exception_handler(request: Request, exc: RequestValidationError):
     """Handle validation errors."""
-    logger.error(f"Validation Error: {exc.errors()}")
+    logger.error("Validation Error: %s", exc.errors())
 
     error_content = {
         "error": {
             "type": "ValidationError",
             "message": "Request validation failed",
             "details": exc.errors(),
-            "path": str(request.url.path),
+            "path": request.url.path,
         }
     }
 
@@ -48,14 +48,14 @@ async def validation_exception_handler(request: Request, exc: RequestValidationE
 
 async def http_exception_handler(request: Request, exc: HTTPException):
     """Handle HTTP exceptions."""
-    logger.error(f"HTTP Exception: {exc.detail}")
+    logger.error("HTTP Exception: %s", exc.detail)
 
     error_content = {
         "error": {
             "type": "HTTPException",
             "message": exc.detail,
             "status_code": exc.status_code,
-            "path": str(request.url.path),
+            "path": request.url.path,
         }
     }
 
@@ -64,31 +64,34 @@ async def http_exception_handler(request: Request, exc: HTTPException):
 
 async def general_exception_handler(request: Request, exc: Exception):
     """Handle general exceptions."""
-    logger.error(f"Unexpected error: {str(exc)}", exc_info=True)
+    logger.error("Unexpected error: %s", exc, exc_info=True)
+
+    # Resolve the path once; the URL object rebuilds it on each access
+    path = request.url.path
 
     # Ensure we always return a proper JSON response
     try:
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=500,
             content={
                 "error": {
                     "type": "InternalServerError",
                     "message": "An unexpected error occurred",
                     "details": {"exception": str(exc)},
-                    "path": str(request.url.path),
+                    "path": path,
                 }
             },
         )
     except Exception as json_error:
         # If even JSON response fails, return a basic error
-        logger.critical(f"Failed to create JSON error response: {json_error}")
-        return JSONResponse(
+        logger.critical("Failed to create JSON error response: %s", json_error)
+        return ORJSONResponse(
             status_code=500,
             content={
                 "error": {
                     "type": "CriticalError",
                     "message": "An unexpected error occurred and error handling failed",
-                    "path": str(request.url.path),
+                    "path": path,
                 }
             },
         )
@@ -96,20 +99,20 @@ async def general_exception_handler(request: Request, exc: Exception):
 
 def create_safe_json_response(
     status_code: int, content: Dict[str, Any], request: Request
-) -> JSONResponse:
+) -> ORJSONResponse:
     """Create a safe JSON response that handles any serialization errors."""
     try:
-        return JSONResponse(status_code=status_code, content=content)
+        return ORJSONResponse(status_code=status_code, content=content)
     except Exception as e:
-        logger.critical(f"Failed to create JSON response: {e}")
+        logger.critical("Failed to create JSON response: %s", e)
         # Return a minimal safe response
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=500,
             content={
                 "error": {
                     "type": "SerializationError",
                     "message": "Failed to serialize error response",
-                    "path": str(request.url.path),
+                    "path": request.url.path,
                 }
             },
         )
@@ -117,7 +120,7 @@ def create_safe_json_response(
 
 async def catch_all_exception_handler(request: Request, exc: Exception):
     """Catch-all exception handler for any unhandled exceptions."""
-    logger.error(f"Unhandled exception: {str(exc)}", exc_info=True)
+    logger.error("Unhandled exception: %s", exc, exc_info=True)
 
     # Get traceback for debugging (only in debug mode)
     traceback_str = None
@@ -128,7 +131,7 @@ async def catch_all_exception_handler(request: Request, exc: Exception):
         "error": {
             "type": "UnhandledException",
             "message": "An unhandled error occurred",
-            "path": str(request.url.path),
+            "path": request.url.path,
             "exception_type": type(exc).__name__,
         }
     }
@@ -147,7 +150,9 @@ def safe_endpoint_wrapper(func):
         try:
             return await func(*args, **kwargs)
         except Exception as e:
-            logger.error(f"Error in endpoint {func.__name__}: {str(e)}", exc_info=True)
+            logger.error(
+                "Error in endpoint %s: %s", func.__name__, e, exc_info=True
+            )
             # Let the global exception handler deal with it
             raise
 
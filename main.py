@@ -3,6 +3,25 @@ from app.core.config import settings
 
 
 if __name__ == "__main__":
+    import os
+
     import uvicorn
 
-    uvicorn.run("main:app", host="0.0.0.0", port=2000, reload=settings.DEBUG)
+    uvicorn.run(
+        "main:app",
+        host="0.0.0.0",
+        port=2000,
+        reload=settings.DEBUG,
+        loop="uvloop",
+        http="httptools",
+        backlog=2048,
+        timeout_keep_alive=75,
+        # reload requires a single worker. Multiple workers are only safe
+        # against a remote ChromaDB server: with the local persistent
+        # client each worker would open its own store, FAISS mirror and
+        # caches on the same directory, and Chroma's local client is not
+        # multi-process-safe for concurrent writers
+        workers=(
+            1 if settings.DEBUG or not settings.CHROMA_HOST else os.cpu_count()
+        ),
+    )
@@ -3,60 +3,50 @@
 Test runner script for the RAG system
 """
 
-import subprocess
-import sys
+import asyncio
 import os
+import sys
 
 
-def run_pytest():
-    """Run pytest tests."""
-    print("🧪 Running pytest tests...")
+async def run_command(label: str, *cmd: str) -> bool:
+    """Run a test command in a subprocess and report its output."""
     try:
-        result = subprocess.run(
-            ["python", "-m", "pytest", "tests/", "-v", "--tb=short"],
+        process = await asyncio.create_subprocess_exec(
+            *cmd,
             cwd=os.path.dirname(__file__),
-            capture_output=True,
-            text=True,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
         )
-        print(result.stdout)
-        if result.stderr:
-            print("STDERR:", result.stderr)
-        return result.returncode == 0
+        stdout, stderr = await process.communicate()
+        print(f"🧪 {label} output:")
+        print(stdout.decode())
+        if stderr:
+            print("STDERR:", stderr.decode())
+        return process.returncode == 0
     except Exception as e:
-        print(f"❌ Error running pytest: {e}")
+        print(f"❌ Error running {label}: {e}")
         return False
 
 
-def run_embedding_tests():
-    """Run embedding tests manually."""
-    print("🧪 Running embedding tests manually...")
-    try:
-        result = subprocess.run(
-            ["python", "tests/test_embeddings.py"],
-            cwd=os.path.dirname(__file__),
-            capture_output=True,
-            text=True,
-        )
-        print(result.stdout)
-        if result.stderr:
-            print("STDERR:", result.stderr)
-        return result.returncode == 0
-    except Exception as e:
-        print(f"❌ Error running embedding tests: {e}")
-        return False
+async def run_all_tests():
+    """Run pytest and the manual embedding tests concurrently.
+
+    The two suites are independent subprocesses, so running them in
+    parallel makes the wall time max(t1, t2) instead of t1 + t2.
+    """
+    return await asyncio.gather(
+        run_command(
+            "pytest tests", "python", "-m", "pytest", "tests/", "-v", "--tb=short"
+        ),
+        run_command("embedding tests", "python", "tests/test_embeddings.py"),
+    )
 
 
 def main():
     """Run all tests."""
     print("🚀 Starting Test Suite\n")
 
-    # Run pytest tests
-    pytest_success = run_pytest()
-    print(f"\nPytest Results: {'✅ PASSED' if pytest_success else '❌ FAILED'}")
-
-    # Run embedding tests manually
-    embedding_success = run_embedding_tests()
-    print(f"Embedding Tests: {'✅ PASSED' if embedding_success else '❌ FAILED'}")
+    pytest_success, embedding_success = asyncio.run(run_all_tests())
 
     # Summary
     print("\n📋 Test Summary:")
@@ -0,0 +1,96 @@
+"""
+Shared pytest fixtures for the RAG system tests.
+"""
+
+import os
+
+# Parallelize the first model download when hf_transfer is installed;
+# must be set before huggingface_hub is imported via the app
+try:
+    import hf_transfer  # noqa: F401
+
+    os.environ.setdefault("HF_HUB_ENABLE_HF_TRANSFER", "1")
+except ImportError:
+    pass
+
+import httpx
+import pytest
+import pytest_asyncio
+from fastapi.testclient import TestClient
+
+from app.app import app
+from app.infrastructure.chroma_repository import ChromaRepository
+from app.infrastructure.embedding_service import embedding_service
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _warm_embedding_model():
+    """Pay the embedding model's first-call warmup once per session.
+
+    The first encode after loading triggers tokenizer and kernel warmup
+    (and graph compilation when COMPILE_EMBEDDINGS is on); doing it here
+    keeps that latency out of whichever test would otherwise run first.
+    """
+    embedding_service.generate_single_embedding("warmup")
+
+
+@pytest.fixture(scope="session")
+def client():
+    """One TestClient shared by the whole session.
+
+    The with-block runs the app lifespan once — startup warmups on entry,
+    shutdown on exit — instead of paying app startup per test module.
+    """
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+@pytest_asyncio.fixture
+async def aclient():
+    """HTTP client speaking ASGI to the app on the test's event loop.
+
+    Unlike TestClient, which bridges sync calls onto a portal thread per
+    request, this invokes the app directly with no thread hop.
+    """
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://testserver"
+    ) as client:
+        yield client
+
+
+@pytest.fixture(scope="module")
+def chroma_repo(tmp_path_factory):
+    """One ChromaRepository shared by all tests in a module.
+
+    Constructing the repository initializes the client, the collection,
+    and the FAISS mirror each time, so building one per test multiplies
+    the suite's startup cost. Tests reset the collection for isolation
+    instead of creating a fresh repository.
+    """
+    return ChromaRepository(
+        persist_directory=str(tmp_path_factory.mktemp("chroma")),
+        collection_name="test_embeddings",
+    )
+
+
+@pytest.fixture(scope="session")
+def sample_txt(tmp_path_factory):
+    """A small text file written once for the whole session."""
+    path = tmp_path_factory.mktemp("uploads") / "sample.txt"
+    path.write_text("This is a test document for file upload testing.")
+    return path
+
+
+@pytest.fixture(scope="session")
+def sample_txt_files(tmp_path_factory):
+    """Two small text files written once for the whole session."""
+    base = tmp_path_factory.mktemp("uploads_multi")
+    paths = []
+    for i in range(2):
+        path = base / f"sample_{i + 1}.txt"
+        path.write_text(
+            f"This is test document {i + 1} for multiple file upload testing."
+        )
+        paths.append(path)
+    return paths
@@ -1,25 +1,24 @@
 import pytest
-from fastapi.testclient import TestClient
-from app.app import app
 
-client = TestClient(app)
 
-
-def test_read_root():
+@pytest.mark.asyncio
+async def test_read_root(aclient):
     """Test root endpoint."""
-    response = client.get("/")
+    response = await aclient.get("/")
     assert response.status_code == 200
     assert "message" in response.json()
 
 
-def test_health_check():
+@pytest.mark.asyncio
+async def test_health_check(aclient):
     """Test health check endpoint."""
-    response = client.get("/health")
+    response = await aclient.get("/health")
     assert response.status_code == 200
     assert response.json()["status"] == "healthy"
 
 
-def test_docs_endpoint():
+@pytest.mark.asyncio
+async def test_docs_endpoint(aclient):
     """Test that docs endpoint is accessible."""
-    response = client.get("/docs")
+    response = await aclient.get("/docs")
     assert response.status_code == 200